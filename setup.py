@@ -18,6 +18,7 @@ setup(
         'azure-storage-blob',  # Azure SDK for Blob Storage
         'boto3',               # AWS SDK for Python
         'click',               # For CLI
+        'PyYAML',              # For targets manifests
     ],
     entry_points={
         'console_scripts': [
@@ -1,6 +1,7 @@
 import logging
 from azure_archival import AzureArchival
 from aws_archival import AWSArchival
+from orchestrator import ACTIONS, TargetOrchestrator
 from utils.secrets import SecretsManager
 from utils.tracability import Traceability
 
@@ -9,18 +10,21 @@ class ArchivalManager:
     ArchivalManager is responsible for managing archival operations for both AWS and Azure.
     """
 
-    def __init__(self, aws_secret_name, aws_region_name, azure_secret_name, azure_key_vault_name):
+    def __init__(self, aws_secret_name=None, aws_region_name=None, azure_secret_name=None, azure_key_vault_name=None):
         """
         Initialize ArchivalManager with AWS and Azure configurations.
 
+        The configurations may be omitted when the manager is only used to drive
+        multi-target runs through perform_targets.
+
         :param aws_secret_name: Name of the AWS secret.
         :param aws_region_name: Name of the AWS region.
         :param azure_secret_name: Name of the Azure secret.
         :param azure_key_vault_name: Name of the Azure key vault.
         """
         self.secrets_manager = SecretsManager()
-        self.aws_secrets = self.secrets_manager.get_aws_secrets(aws_secret_name, aws_region_name)
-        self.azure_secrets = self.secrets_manager.get_azure_secrets(azure_secret_name, azure_key_vault_name)
+        self.aws_secrets = self.secrets_manager.get_aws_secrets(aws_secret_name, aws_region_name) if aws_secret_name else {}
+        self.azure_secrets = self.secrets_manager.get_azure_secrets(azure_secret_name, azure_key_vault_name) if azure_secret_name else {}
         self.cloud_provider = None
         self.traceability = Traceability()
         self.logger = logging.getLogger(__name__)
@@ -51,3 +55,51 @@ class ArchivalManager:
         except Exception as e:
             self.logger.error(f"Failed to perform {action} on {data_type} for {self.cloud_provider}: {str(e)}")
             self.traceability.log_movement(self.cloud_provider, action, "path_placeholder", tier=data_type, status="failure", error_message=str(e))
+
+    def perform_targets(self, targets, action, data_type, max_concurrency):
+        """
+        Perform the specified action concurrently over many buckets and file systems.
+
+        :param targets: List of Target to process, across AWS and Azure.
+        :param action: The action to be performed (archive, restore, delete).
+        :param data_type: The type of data to be processed.
+        :param max_concurrency: Maximum number of objects processed at once across all targets.
+        :return: ProgressTracker with the consolidated progress of all targets.
+        :raises ValueError: If the action is not supported.
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"Unsupported action {action!r}, expected one of {', '.join(ACTIONS)}")
+        orchestrator = TargetOrchestrator(max_concurrency)
+        for target in targets:
+            service = "Azure" if target.cloud == 'azure' else "AWS"
+            if action == 'restore' and target.cloud == 'azure':
+                error_message = "restore is not supported for Azure targets"
+                self.logger.error(f"Skipping target {target.name}: {error_message}")
+                self.traceability.log_movement(service, action, target.name, tier=data_type, status="failure", error_message=error_message)
+                orchestrator.add_failed_target(target.name, service, error_message)
+                continue
+            try:
+                orchestrator.add_target(target.name, service, self._create_archival(target), target.max_concurrency)
+            except Exception as e:
+                self.logger.error(f"Failed to set up target {target.name}: {str(e)}")
+                self.traceability.log_movement(service, action, target.name, tier=data_type, status="failure", error_message=str(e))
+                orchestrator.add_failed_target(target.name, service, str(e))
+        progress = orchestrator.run(action, data_type)
+        if progress.failed or progress.failed_targets:
+            self.logger.error(f"Finished {action} on {data_type} over {len(targets)} targets with {progress.failed} failed objects "
+                              f"and {len(progress.failed_targets)} failed targets")
+        else:
+            self.logger.info(f"Successfully performed {action} on {data_type} over {len(targets)} targets")
+        return progress
+
+    def _create_archival(self, target):
+        """
+        Create the archival client bound to a single target.
+
+        :param target: The Target to create the client for.
+        :return: AWSArchival or AzureArchival instance.
+        """
+        if target.cloud == 'azure':
+            return AzureArchival(target.secret_name, target.key_vault_name,
+                                 file_system_name=target.file_system_name, container_name=target.container_name)
+        return AWSArchival(target.secret_name, target.region_name, bucket_name=target.bucket_name)
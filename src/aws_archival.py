@@ -13,18 +13,19 @@ class AWSArchival:
     AWSArchival is responsible for archiving files to AWS S3.
     """
 
-    def __init__(self, secret_name, region_name):
+    def __init__(self, secret_name, region_name, bucket_name=None):
         """
         Initialize AWSArchival with AWS credentials and bucket name.
 
         :param secret_name: Name of the secret in AWS Secrets Manager.
         :param region_name: AWS region name.
+        :param bucket_name: Bucket to operate on. Defaults to the bucket stored in the secret.
         """
         self.secrets_manager = SecretsManager()
         self.secrets = self.secrets_manager.get_aws_secrets(secret_name, region_name)
         self.aws_access_key_id = self.secrets["aws_access_key_id"]
         self.aws_secret_access_key = self.secrets["aws_secret_access_key"]
-        self.bucket_name = self.secrets["bucket_name"]
+        self.bucket_name = bucket_name or self.secrets["bucket_name"]
         self.s3 = boto3.client('s3', aws_access_key_id=self.aws_access_key_id, aws_secret_access_key=self.aws_secret_access_key)
         self.traceability = Traceability()
 
@@ -34,6 +35,7 @@ class AWSArchival:
 
         :param object_key: Key of the object in S3.
         :param retention_period: Retention period of the object in days.
+        :return: True if the object was moved, False otherwise.
         """
         try:
             if retention_period <= 90:
@@ -47,25 +49,31 @@ class AWSArchival:
                 self.s3.copy_object(Bucket=self.bucket_name, CopySource={'Bucket': self.bucket_name, 'Key': object_key}, Key=object_key, StorageClass='GLACIER')
             else:
                 logger.warning(f"{object_key} exceeds maximum retention period and will be deleted.")
-                self.delete_object(object_key)
+                return self.delete_object(object_key)
             self.traceability.log_movement("AWS", "move", object_key, tier="archival")
+            return True
         except Exception as e:
             logger.error(f"Error moving {object_key}: {str(e)}")
             self.traceability.log_movement("AWS", "move", object_key, tier="archival", status="failure", error_message=str(e))
+            return False
 
-    def delete_object(self, object_key):
+    def delete_object(self, object_key, tier="archival"):
         """
         Delete an object from the S3 bucket.
 
         :param object_key: Key of the object in S3.
+        :param tier: Tier recorded in the traceability log.
+        :return: True if the object was deleted, False otherwise.
         """
         try:
             self.s3.delete_object(Bucket=self.bucket_name, Key=object_key)
             logger.info(f"Deleted {object_key} from {self.bucket_name}.")
-            self.traceability.log_movement("AWS", "delete", object_key, tier="archival")
+            self.traceability.log_movement("AWS", "delete", object_key, tier=tier)
+            return True
         except Exception as e:
             logger.error(f"Error deleting {object_key}: {str(e)}")
-            self.traceability.log_movement("AWS", "delete", object_key, tier="archival", status="failure", error_message=str(e))
+            self.traceability.log_movement("AWS", "delete", object_key, tier=tier, status="failure", error_message=str(e))
+            return False
 
     def list_objects(self):
         """
@@ -81,6 +89,70 @@ class AWSArchival:
         except Exception as e:
             logger.error(f"Error listing objects in {self.bucket_name}: {str(e)}")
 
+    def list_items(self):
+        """
+        Lazily list all objects in the S3 bucket, one page at a time.
+
+        :return: Iterator over the object summaries in the bucket.
+        """
+        paginator = self.s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name):
+            for obj in page.get('Contents', []):
+                yield obj
+
+    def archive_item(self, obj, data_type):
+        """
+        Archive a single object based on its age.
+
+        :param obj: Object summary as returned by list_items.
+        :param data_type: Type of data to be archived.
+        :return: True if the object was processed successfully, False otherwise.
+        """
+        object_key = obj['Key']
+        last_modified = obj['LastModified']
+        retention_period = (datetime.now(last_modified.tzinfo) - last_modified).days
+        moved = self.move_to_archival(object_key, retention_period)
+        self.traceability.log_movement("AWS", "archive", object_key, tier=data_type, status="success" if moved else "failure")
+        return moved
+
+    def restore_item(self, obj, data_type):
+        """
+        Restore a single object to the STANDARD storage class.
+
+        :param obj: Object summary as returned by list_items.
+        :param data_type: Type of data to be restored.
+        :return: True if the object was restored, False otherwise.
+        """
+        object_key = obj['Key']
+        try:
+            logger.info(f"Restoring object: {object_key}")
+            self.s3.copy_object(Bucket=self.bucket_name, CopySource={'Bucket': self.bucket_name, 'Key': object_key}, Key=object_key, StorageClass='STANDARD')
+            self.traceability.log_movement("AWS", "restore", object_key, tier=data_type)
+            return True
+        except Exception as e:
+            logger.error(f"Error restoring {object_key}: {str(e)}")
+            self.traceability.log_movement("AWS", "restore", object_key, tier=data_type, status="failure", error_message=str(e))
+            return False
+
+    def delete_item(self, obj, data_type):
+        """
+        Delete a single object if its age matches the data type.
+
+        :param obj: Object summary as returned by list_items.
+        :param data_type: Type of data to be deleted.
+        :return: True if the object was deleted or not eligible, False if the delete failed.
+        """
+        object_key = obj['Key']
+        last_modified = obj['LastModified']
+        retention_period = (datetime.now(last_modified.tzinfo) - last_modified).days
+        if data_type == 'real_time' and retention_period <= 90:
+            return self.delete_object(object_key, tier=data_type)
+        elif data_type == 'reference' and 90 < retention_period <= 1460:
+            return self.delete_object(object_key, tier=data_type)
+        elif data_type == 'archival' and 1460 < retention_period <= 3650:
+            return self.delete_object(object_key, tier=data_type)
+        return True
+
     def archive_data(self, data_type):
         """
         Archive data based on its type.
@@ -89,15 +161,11 @@ class AWSArchival:
         """
         logger.info("Starting archival process.")
         try:
-            response = self.s3.list_objects_v2(Bucket=self.bucket_name)
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    object_key = obj['Key']
-                    last_modified = obj['LastModified']
-                    retention_period = (datetime.now(last_modified.tzinfo) - last_modified).days
-                    self.move_to_archival(object_key, retention_period)
-                    self.traceability.log_movement("AWS", "archive", object_key, tier=data_type)
-            else:
+            found = False
+            for obj in self.list_items():
+                found = True
+                self.archive_item(obj, data_type)
+            if not found:
                 logger.info("No objects found in the bucket.")
         except Exception as e:
             logger.error(f"Error during archival process: {str(e)}")
@@ -111,14 +179,11 @@ class AWSArchival:
         """
         logger.info("Starting restore process.")
         try:
-            response = self.s3.list_objects_v2(Bucket=self.bucket_name)
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    object_key = obj['Key']
-                    logger.info(f"Restoring object: {object_key}")
-                    self.s3.copy_object(Bucket=self.bucket_name, CopySource={'Bucket': self.bucket_name, 'Key': object_key}, Key=object_key, StorageClass='STANDARD')
-                    self.traceability.log_movement("AWS", "restore", object_key, tier=data_type)
-            else:
+            found = False
+            for obj in self.list_items():
+                found = True
+                self.restore_item(obj, data_type)
+            if not found:
                 logger.info("No objects found in the bucket.")
         except Exception as e:
             logger.error(f"Error restoring data: {str(e)}")
@@ -132,21 +197,11 @@ class AWSArchival:
         """
         logger.info("Starting delete process.")
         try:
-            response = self.s3.list_objects_v2(Bucket=self.bucket_name)
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    object_key = obj['Key']
-                    last_modified = obj['LastModified']
-                    retention_period = (datetime.now(last_modified.tzinfo) - last_modified).days
-                    if data_type == 'real_time' and retention_period <= 90:
-                        self.delete_object(object_key)
-                    elif data_type == 'reference' and 90 < retention_period <= 1460:
-                        self.delete_object(object_key)
-                    elif data_type == 'archival' and 1460 < retention_period <= 3650:
-                        self.delete_object(object_key)
-                    logger.info(f"Deleted {object_key} from {self.bucket_name}.")
-                    self.traceability.log_movement("AWS", "delete", object_key, tier=data_type)
-            else:
+            found = False
+            for obj in self.list_items():
+                found = True
+                self.delete_item(obj, data_type)
+            if not found:
                 logger.info("No objects found in the bucket.")
         except Exception as e:
             logger.error(f"Error during delete process: {str(e)}")
@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from utils.secrets import SecretsManager
 import os
 from azure.storage.blob import BlobServiceClient
-from utils.traceability import Traceability
+from utils.tracability import Traceability
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -15,12 +15,14 @@ class AzureArchival:
     AzureArchival is responsible for archiving files to Azure Blob Storage.
     """
 
-    def __init__(self, secret_name, key_vault_name):
+    def __init__(self, secret_name, key_vault_name, file_system_name=None, container_name=None):
         """
         Initialize AzureArchival with secret name and key vault name.
 
         :param secret_name: Name of the secret in Azure Key Vault.
         :param key_vault_name: Name of the Azure Key Vault.
+        :param file_system_name: Name of the ADLS file system to operate on.
+        :param container_name: Name of the blob container used for uploads.
         """
         self.secrets_manager = SecretsManager()
         self.secrets = self.secrets_manager.get_azure_secrets(secret_name, key_vault_name)
@@ -28,7 +30,7 @@ class AzureArchival:
         self.service_client = DataLakeServiceClient.from_connection_string(self.connection_string)
         self.file_system_name = file_system_name
         self.blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
-        self.container_client = self.blob_service_client.get_container_client(container_name)
+        self.container_client = self.blob_service_client.get_container_client(container_name) if container_name else None
         self.traceability = Traceability()
 
     def archive_data(self, data_type):
@@ -40,20 +42,33 @@ class AzureArchival:
         logger.info("Starting archival process.")
         paths = self.list_paths(self.file_system_name)
         for path in paths:
-            file_client = self.service_client.get_file_system_client(self.file_system_name).get_file_client(path)
-            properties = file_client.get_file_properties()
-            last_modified = properties['last_modified']
-            try:
-                if data_type == 'real_time' and self.is_real_time_data(last_modified):
-                    self.move_to_storage_tier(file_client, "real-time")
-                elif data_type == 'reference' and self.is_reference_data(last_modified):
-                    self.move_to_storage_tier(file_client, "reference")
-                elif data_type == 'archival' and self.is_archival_data(last_modified):
-                    self.move_to_storage_tier(file_client, "archival")
-                self.traceability.log_movement("Azure", "archive", path, tier=data_type)
-            except Exception as e:
-                logger.error(f"Error archiving {path}: {str(e)}")
-                self.traceability.log_movement("Azure", "archive", path, tier=data_type, status="failure", error_message=str(e))
+            self.archive_item(path, data_type)
+
+    def archive_item(self, path, data_type):
+        """
+        Archive a single path based on its age.
+
+        :param path: Path in the file system, as returned by list_items.
+        :param data_type: Type of data to be archived (real_time, reference, archival).
+        :return: True if the path was moved or not eligible, False if the move failed.
+        """
+        try:
+            file_client = self._get_file_client(path)
+            last_modified = file_client.get_file_properties()['last_modified']
+            if data_type == 'real_time' and self.is_real_time_data(last_modified):
+                moved = self.move_to_storage_tier(file_client, "real-time")
+            elif data_type == 'reference' and self.is_reference_data(last_modified):
+                moved = self.move_to_storage_tier(file_client, "reference")
+            elif data_type == 'archival' and self.is_archival_data(last_modified):
+                moved = self.move_to_storage_tier(file_client, "archival")
+            else:
+                return True
+            self.traceability.log_movement("Azure", "archive", path, tier=data_type, status="success" if moved else "failure")
+            return moved
+        except Exception as e:
+            logger.error(f"Error archiving {path}: {str(e)}")
+            self.traceability.log_movement("Azure", "archive", path, tier=data_type, status="failure", error_message=str(e))
+            return False
 
     def restore_data(self, data_type):
         """
@@ -70,6 +85,21 @@ class AzureArchival:
             logger.error(f"Error restoring data: {str(e)}")
             self.traceability.log_movement("Azure", "restore", "path_placeholder", tier=data_type, status="failure", error_message=str(e))
 
+    def restore_item(self, path, data_type):
+        """
+        Restore a single path based on the data type.
+
+        Per-path restore is not implemented for ADLS yet, so every path is recorded as a failure.
+
+        :param path: Path in the file system, as returned by list_items.
+        :param data_type: Type of data to be restored (real_time, reference, archival).
+        :return: False, since nothing is restored.
+        """
+        error_message = "restore is not supported for Azure targets"
+        logger.error(f"Error restoring {path}: {error_message}")
+        self.traceability.log_movement("Azure", "restore", path, tier=data_type, status="failure", error_message=error_message)
+        return False
+
     def delete_data(self, data_type):
         """
         Delete data based on the data type.
@@ -79,21 +109,34 @@ class AzureArchival:
         logger.info("Starting delete process.")
         paths = self.list_paths(self.file_system_name)
         for path in paths:
-            file_client = self.service_client.get_file_system_client(self.file_system_name).get_file_client(path)
-            properties = file_client.get_file_properties()
-            last_modified = properties['last_modified']
-            try:
-                if data_type == 'real_time' and self.is_real_time_data(last_modified):
-                    file_client.delete_file()
-                elif data_type == 'reference' and self.is_reference_data(last_modified):
-                    file_client.delete_file()
-                elif data_type == 'archival' and self.is_archival_data(last_modified):
-                    file_client.delete_file()
-                logger.info(f"Deleted {path} from {self.file_system_name}.")
-                self.traceability.log_movement("Azure", "delete", path, tier=data_type)
-            except Exception as e:
-                logger.error(f"Error deleting {path}: {str(e)}")
-                self.traceability.log_movement("Azure", "delete", path, tier=data_type, status="failure", error_message=str(e))
+            self.delete_item(path, data_type)
+
+    def delete_item(self, path, data_type):
+        """
+        Delete a single path if its age matches the data type.
+
+        :param path: Path in the file system, as returned by list_items.
+        :param data_type: Type of data to be deleted (real_time, reference, archival).
+        :return: True if the path was deleted or not eligible, False if the delete failed.
+        """
+        try:
+            file_client = self._get_file_client(path)
+            last_modified = file_client.get_file_properties()['last_modified']
+            if data_type == 'real_time' and self.is_real_time_data(last_modified):
+                file_client.delete_file()
+            elif data_type == 'reference' and self.is_reference_data(last_modified):
+                file_client.delete_file()
+            elif data_type == 'archival' and self.is_archival_data(last_modified):
+                file_client.delete_file()
+            else:
+                return True
+            logger.info(f"Deleted {path} from {self.file_system_name}.")
+            self.traceability.log_movement("Azure", "delete", path, tier=data_type)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting {path}: {str(e)}")
+            self.traceability.log_movement("Azure", "delete", path, tier=data_type, status="failure", error_message=str(e))
+            return False
 
     def list_paths(self, file_system_name):
         """
@@ -106,6 +149,25 @@ class AzureArchival:
         paths = [path.name for path in file_system_client.get_paths()]
         return paths
 
+    def list_items(self):
+        """
+        Lazily list all paths in the configured file system, one page at a time.
+
+        :return: Iterator over the path names in the file system.
+        """
+        file_system_client = self.service_client.get_file_system_client(self.file_system_name)
+        for path in file_system_client.get_paths():
+            yield path.name
+
+    def _get_file_client(self, path):
+        """
+        Get a file client for a path in the configured file system.
+
+        :param path: Path in the file system.
+        :return: File client for the path.
+        """
+        return self.service_client.get_file_system_client(self.file_system_name).get_file_client(path)
+
     def is_real_time_data(self, last_modified):
         """
         Check if the data is real-time data.
@@ -139,15 +201,18 @@ class AzureArchival:
 
         :param file_client: File client for the file to be moved.
         :param tier: Storage tier to move the file to.
+        :return: True if the file was moved, False otherwise.
         """
         try:
             # Logic to move the file to the appropriate storage tier
             logger.info(f"Moving {file_client.path} to {tier} storage tier.")
             file_client.set_access_tier(tier)
             self.traceability.log_movement("Azure", "move", file_client.path, tier=tier)
+            return True
         except Exception as e:
             logger.error(f"Error moving {file_client.path} to {tier} storage tier: {str(e)}")
             self.traceability.log_movement("Azure", "move", file_client.path, tier=tier, status="failure", error_message=str(e))
+            return False
 
     def upload_file(self, file_path, blob_name):
         """
@@ -1,7 +1,9 @@
 import click
 import logging
+import yaml
 from src.archival_manager import ArchivalManager
 from src.utils.secrets import SecretsManager
+from src.utils.targets import load_targets
 from utils.tracability import Traceability
 
 class CLI:
@@ -54,12 +56,30 @@ def archive_to_azure(file_path, blob_name):
 
 @click.command()
 @click.argument('data_type')
-def auto_archive(data_type):
+@click.option('--targets', 'targets_file', type=click.Path(exists=True, dir_okay=False),
+              help='YAML manifest of buckets and file systems to archive concurrently.')
+@click.option('--max-concurrency', type=click.IntRange(min=1), default=None,
+              help='Override the global concurrency budget of the targets manifest.')
+def auto_archive(data_type, targets_file, max_concurrency):
     """
     Command to auto archive all qualifying blobs or buckets.
 
     :param data_type: Type of data to be archived (real_time, reference, archival).
+    :param targets_file: Optional targets manifest to archive many buckets and file systems at once.
+    :param max_concurrency: Optional override of the manifest global concurrency budget.
     """
+    if targets_file:
+        try:
+            targets, manifest_concurrency = load_targets(targets_file)
+        except (ValueError, yaml.YAMLError) as e:
+            raise click.BadParameter(str(e), param_hint='--targets')
+        archival_manager = ArchivalManager()
+        progress = archival_manager.perform_targets(targets, 'archive', data_type, max_concurrency or manifest_concurrency)
+        for line in progress.summary_lines():
+            click.echo(line)
+        if progress.failed or progress.failed_targets:
+            raise click.ClickException(f"{progress.failed} objects failed, {len(progress.failed_targets)} targets errored")
+        return
     secrets_manager = SecretsManager()
     aws_secrets = secrets_manager.get_aws_secrets('my_aws_secret', 'us-west-2')
     azure_secrets = secrets_manager.get_azure_secrets('my_azure_secret', 'my_key_vault')
@@ -0,0 +1,302 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from utils.tracability import Traceability
+
+logger = logging.getLogger(__name__)
+
+ACTIONS = ('archive', 'restore', 'delete')
+
+# Markers placed on a lane queue by its prefetch thread, and returned while the queue is empty.
+_END = object()
+_EMPTY = object()
+
+class _ListingError:
+    """
+    Marker placed on a lane queue when listing the target failed.
+    """
+
+    def __init__(self, error):
+        self.error = error
+
+class TargetProgress:
+    """
+    TargetProgress holds the progress counters of a single target.
+    """
+
+    def __init__(self, name, service):
+        self.name = name
+        self.service = service
+        self.listed = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.listing_done = False
+        self.error = None
+
+    @property
+    def done(self):
+        return (self.listing_done or self.error is not None) and self.in_flight == 0
+
+    def summary(self):
+        """
+        Build a one-line summary of the target progress.
+
+        :return: Summary string.
+        """
+        state = "failed" if self.error else "done" if self.done else "running"
+        line = (f"{self.name} [{self.service}] {state}: {self.listed} listed, {self.succeeded} succeeded, "
+                f"{self.failed} failed, {self.in_flight} in flight")
+        if self.error:
+            line += f" ({self.error})"
+        return line
+
+class ProgressTracker:
+    """
+    ProgressTracker consolidates the progress of all targets of a multi-target run.
+
+    The listed counter of a target is only updated by its prefetch thread, and all other
+    counters only by the dispatching thread, so each counter has a single writer and no
+    locking is needed.
+    """
+
+    def __init__(self):
+        self.targets = {}
+
+    def register(self, name, service):
+        """
+        Register a target to track.
+
+        :param name: Name of the target.
+        :param service: Cloud service of the target (AWS or Azure).
+        :return: The TargetProgress of the target.
+        """
+        self.targets[name] = TargetProgress(name, service)
+        return self.targets[name]
+
+    @property
+    def succeeded(self):
+        return sum(progress.succeeded for progress in self.targets.values())
+
+    @property
+    def failed(self):
+        return sum(progress.failed for progress in self.targets.values())
+
+    @property
+    def failed_targets(self):
+        return [progress.name for progress in self.targets.values() if progress.error]
+
+    def summary_lines(self):
+        """
+        Build the consolidated progress view, one line per target plus a total.
+
+        :return: List of summary strings.
+        """
+        lines = [progress.summary() for progress in self.targets.values()]
+        finished = sum(1 for progress in self.targets.values() if progress.done)
+        lines.append(f"Total: {finished}/{len(self.targets)} targets finished, {self.succeeded} succeeded, "
+                     f"{self.failed} failed, {len(self.failed_targets)} targets errored")
+        return lines
+
+    def log_summary(self):
+        """
+        Log the consolidated progress view.
+        """
+        for line in self.summary_lines():
+            logger.info(line)
+
+class _Lane:
+    """
+    Scheduling state of a single target: its archival client, prefetched objects and concurrency budget.
+    """
+
+    def __init__(self, name, service, archival, max_concurrency, progress, prefetch_size):
+        self.name = name
+        self.service = service
+        self.archival = archival
+        self.max_concurrency = max_concurrency
+        self.progress = progress
+        self.items = queue.Queue(maxsize=prefetch_size)
+
+class TargetOrchestrator:
+    """
+    TargetOrchestrator fans an action out over many targets concurrently.
+
+    Objects of all targets share one global worker pool. Targets are served round-robin,
+    one object at a time, and each target is capped by its own concurrency budget, so a
+    large bucket cannot monopolise the pool and starve smaller ones.
+
+    Each target is listed by its own prefetch thread into a bounded queue, so a slow
+    listing page only delays that target and never blocks the dispatching thread.
+    """
+
+    def __init__(self, max_concurrency, progress_interval=30, prefetch_size=1000):
+        """
+        Initialize TargetOrchestrator.
+
+        :param max_concurrency: Maximum number of objects processed at once across all targets.
+        :param progress_interval: Seconds between consolidated progress log lines.
+        :param prefetch_size: Maximum number of listed objects buffered per target.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        self.max_concurrency = max_concurrency
+        self.progress_interval = progress_interval
+        self.prefetch_size = prefetch_size
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self.progress = ProgressTracker()
+        self.traceability = Traceability()
+        self.lanes = []
+
+    def add_target(self, name, service, archival, max_concurrency):
+        """
+        Add a target to the run.
+
+        :param name: Name of the target.
+        :param service: Cloud service of the target (AWS or Azure).
+        :param archival: AWSArchival or AzureArchival instance bound to the target.
+        :param max_concurrency: Maximum number of objects of this target processed at once.
+        """
+        progress = self.progress.register(name, service)
+        self.lanes.append(_Lane(name, service, archival, max_concurrency, progress, self.prefetch_size))
+
+    def add_failed_target(self, name, service, error_message):
+        """
+        Record a target that could not be set up, so it shows up in the progress view.
+
+        :param name: Name of the target.
+        :param service: Cloud service of the target (AWS or Azure).
+        :param error_message: Reason the target could not be set up.
+        """
+        self.progress.register(name, service).error = error_message
+
+    def run(self, action, data_type):
+        """
+        Run the action over all targets and wait for completion.
+
+        :param action: The action to be performed (archive, restore, delete).
+        :param data_type: The type of data to be processed.
+        :return: The ProgressTracker of the run.
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"Unsupported action {action!r}, expected one of {', '.join(ACTIONS)}")
+        logger.info(f"Starting {action} of {data_type} over {len(self.lanes)} targets "
+                    f"with max concurrency {self.max_concurrency}")
+        pending = deque(self.lanes)
+        in_flight = {}
+        last_report = time.monotonic()
+        self._stop.clear()
+        for lane in self.lanes:
+            threading.Thread(target=self._prefetch, args=(lane,), name=f"retainx-list-{lane.name}", daemon=True).start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="retainx") as executor:
+                while pending or in_flight:
+                    self._wakeup.clear()
+                    for future in [future for future in in_flight if future.done()]:
+                        self._complete(in_flight.pop(future), future)
+                    self._schedule(executor, pending, in_flight, action, data_type)
+                    if time.monotonic() - last_report >= self.progress_interval:
+                        self.progress.log_summary()
+                        last_report = time.monotonic()
+                    if pending or in_flight:
+                        self._wakeup.wait(self.progress_interval)
+        finally:
+            self._stop.set()
+        self.progress.log_summary()
+        return self.progress
+
+    def _prefetch(self, lane):
+        """
+        List a target page by page into its queue, ending with _END or a _ListingError.
+
+        Runs on a dedicated thread per target.
+        """
+        try:
+            for item in lane.archival.list_items():
+                lane.progress.listed += 1
+                if not self._put(lane, item):
+                    return
+            self._put(lane, _END)
+        except Exception as e:
+            self._put(lane, _ListingError(e))
+
+    def _put(self, lane, item):
+        """
+        Put an item on a lane queue, waiting for room unless the run is stopping.
+
+        :return: True if the item was queued, False if the run stopped first.
+        """
+        while not self._stop.is_set():
+            try:
+                lane.items.put(item, timeout=0.5)
+                self._wakeup.set()
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _schedule(self, executor, pending, in_flight, action, data_type):
+        """
+        Submit objects round-robin across targets until the global budget is used up
+        or every remaining target is at its own budget or waiting for its listing.
+        """
+        blocked = 0
+        while pending and len(in_flight) < self.max_concurrency and blocked < len(pending):
+            lane = pending[0]
+            pending.rotate(-1)
+            if lane.progress.in_flight >= lane.max_concurrency:
+                blocked += 1
+                continue
+            item = self._next_item(lane)
+            if item is _EMPTY:
+                blocked += 1
+                continue
+            if item is _END:
+                pending.remove(lane)
+                continue
+            handler = getattr(lane.archival, f"{action}_item")
+            future = executor.submit(handler, item, data_type)
+            future.add_done_callback(lambda _: self._wakeup.set())
+            in_flight[future] = lane
+            lane.progress.in_flight += 1
+            blocked = 0
+
+    def _next_item(self, lane):
+        """
+        Take the next prefetched object of a target without blocking.
+
+        :return: The next object, _EMPTY while the listing is still running, or _END when
+                 the target has no more objects.
+        """
+        try:
+            item = lane.items.get_nowait()
+        except queue.Empty:
+            return _EMPTY
+        if item is _END:
+            lane.progress.listing_done = True
+            logger.info(f"Finished listing {lane.progress.listed} objects of {lane.name}")
+        elif isinstance(item, _ListingError):
+            lane.progress.error = str(item.error)
+            logger.error(f"Failed to list objects of {lane.name}: {str(item.error)}")
+            self.traceability.log_movement(lane.service, "list", lane.name, status="failure", error_message=str(item.error))
+            return _END
+        return item
+
+    def _complete(self, lane, future):
+        """
+        Record the outcome of a finished object.
+        """
+        lane.progress.in_flight -= 1
+        try:
+            succeeded = future.result() is not False
+        except Exception as e:
+            logger.error(f"Unexpected error processing an object of {lane.name}: {str(e)}")
+            succeeded = False
+        if succeeded:
+            lane.progress.succeeded += 1
+        else:
+            lane.progress.failed += 1
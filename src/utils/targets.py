@@ -0,0 +1,115 @@
+import logging
+import yaml
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_TARGET_CONCURRENCY = 4
+
+class Target:
+    """
+    Target describes a single bucket or file system taking part in a multi-target archival run.
+    """
+
+    def __init__(self, name, cloud, secret_name, region_name=None, key_vault_name=None,
+                 bucket_name=None, file_system_name=None, container_name=None,
+                 max_concurrency=DEFAULT_TARGET_CONCURRENCY):
+        """
+        Initialize a Target.
+
+        :param name: Unique name of the target, used in logs and progress reports.
+        :param cloud: Cloud provider of the target (aws or azure).
+        :param secret_name: Name of the secret holding the target credentials.
+        :param region_name: AWS region of the secret (AWS only).
+        :param key_vault_name: Name of the Azure key vault holding the secret (Azure only).
+        :param bucket_name: S3 bucket to operate on (AWS only, defaults to the bucket in the secret).
+        :param file_system_name: ADLS file system to operate on (Azure only).
+        :param container_name: Blob container used for uploads (Azure only).
+        :param max_concurrency: Maximum number of objects of this target processed at once.
+        """
+        self.name = name
+        self.cloud = cloud
+        self.secret_name = secret_name
+        self.region_name = region_name
+        self.key_vault_name = key_vault_name
+        self.bucket_name = bucket_name
+        self.file_system_name = file_system_name
+        self.container_name = container_name
+        self.max_concurrency = max_concurrency
+
+    def __repr__(self):
+        return f"Target(name={self.name!r}, cloud={self.cloud!r})"
+
+def _parse_concurrency(value, owner):
+    """
+    Validate a max_concurrency value from the manifest.
+
+    :param value: Value read from the manifest.
+    :param owner: Description of where the value comes from, used in error messages.
+    :return: The validated concurrency.
+    """
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f"{owner} must have a positive integer 'max_concurrency', got {value!r}")
+    return value
+
+def _parse_target(entry, defaults):
+    """
+    Build a Target from a manifest entry, applying manifest defaults.
+
+    :param entry: Dictionary describing the target.
+    :param defaults: Dictionary of default values shared by all targets.
+    :return: The parsed Target.
+    """
+    if not isinstance(entry, dict):
+        raise ValueError(f"Target entries must be mappings, got {entry!r}")
+    values = {**defaults, **entry}
+    cloud = str(values.get('cloud', '')).lower()
+    if cloud not in ('aws', 'azure'):
+        raise ValueError(f"Target {values.get('name')!r} has unsupported cloud {values.get('cloud')!r}, expected 'aws' or 'azure'")
+    if not values.get('secret_name'):
+        raise ValueError(f"Target {values.get('name')!r} is missing 'secret_name'")
+    if cloud == 'aws' and not values.get('region_name'):
+        raise ValueError(f"AWS target {values.get('name')!r} is missing 'region_name'")
+    if cloud == 'azure' and not (values.get('key_vault_name') and values.get('file_system_name')):
+        raise ValueError(f"Azure target {values.get('name')!r} requires 'key_vault_name' and 'file_system_name'")
+    name = values.get('name') or values.get('bucket_name') or values.get('file_system_name') or values['secret_name']
+    max_concurrency = _parse_concurrency(values.get('max_concurrency', DEFAULT_TARGET_CONCURRENCY), f"Target {name!r}")
+    return Target(
+        name=name,
+        cloud=cloud,
+        secret_name=values['secret_name'],
+        region_name=values.get('region_name'),
+        key_vault_name=values.get('key_vault_name'),
+        bucket_name=values.get('bucket_name'),
+        file_system_name=values.get('file_system_name'),
+        container_name=values.get('container_name'),
+        max_concurrency=max_concurrency,
+    )
+
+def load_targets(manifest_path):
+    """
+    Load archival targets from a YAML (or JSON) manifest.
+
+    The manifest holds a global ``max_concurrency`` budget, optional ``defaults``
+    applied to every target, and a ``targets`` list of buckets and file systems.
+
+    :param manifest_path: Path to the manifest file.
+    :return: Tuple of (list of Target, global max concurrency).
+    :raises ValueError: If the manifest is malformed.
+    :raises yaml.YAMLError: If the manifest is not valid YAML.
+    """
+    with open(manifest_path, 'r') as file:
+        manifest = yaml.safe_load(file) or {}
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('targets'), list):
+        raise ValueError(f"Manifest {manifest_path} must define a 'targets' list")
+    defaults = manifest.get('defaults') or {}
+    if not isinstance(defaults, dict):
+        raise ValueError(f"Manifest {manifest_path} 'defaults' must be a mapping")
+    targets = [_parse_target(entry, defaults) for entry in manifest['targets']]
+    names = [target.name for target in targets]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Manifest {manifest_path} has duplicate target names: {', '.join(duplicates)}")
+    max_concurrency = _parse_concurrency(manifest.get('max_concurrency', DEFAULT_MAX_CONCURRENCY), f"Manifest {manifest_path}")
+    logger.info(f"Loaded {len(targets)} targets from {manifest_path}")
+    return targets, max_concurrency
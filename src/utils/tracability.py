@@ -2,6 +2,7 @@ import logging
 from datetime import datetime
 import csv
 import os
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -12,6 +13,9 @@ class Traceability:
     Traceability class to maintain all the movements for data archival.
     """
 
+    # Shared by all instances, since concurrent archival jobs append to the same CSV file.
+    _csv_lock = threading.Lock()
+
     def __init__(self, csv_file_path="./resources/tracker.csv"):
         self.movements = []
         self.csv_file_path = csv_file_path
@@ -56,9 +60,10 @@ class Traceability:
 
         :param movement: The movement dictionary to log.
         """
-        with open(self.csv_file_path, mode='a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(movement.values())
+        with self._csv_lock:
+            with open(self.csv_file_path, mode='a', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(movement.values())
 
     def get_movements(self):
         """
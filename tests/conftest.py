@@ -0,0 +1,136 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+import boto3
+import azure_archival
+from utils.secrets import SecretsManager
+
+@pytest.fixture(autouse=True)
+def tracker_dir(tmp_path, monkeypatch):
+    """
+    Run each test from a temporary directory so Traceability writes its CSV there.
+    """
+    (tmp_path / 'resources').mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+class FakeS3:
+    """
+    In-memory stand-in for the boto3 S3 client.
+    """
+
+    def __init__(self):
+        self.pages = []
+        self.failing = set()
+        self.paginated_buckets = []
+        self.copies = []
+        self.deletes = []
+
+    def get_paginator(self, operation):
+        assert operation == 'list_objects_v2'
+        return self
+
+    def paginate(self, Bucket):
+        self.paginated_buckets.append(Bucket)
+        yield from self.pages
+
+    def copy_object(self, Bucket, CopySource, Key, StorageClass):
+        if Key in self.failing:
+            raise RuntimeError(f"copy of {Key} denied")
+        self.copies.append((Bucket, Key, StorageClass))
+
+    def delete_object(self, Bucket, Key):
+        if Key in self.failing:
+            raise RuntimeError(f"delete of {Key} denied")
+        self.deletes.append((Bucket, Key))
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    """
+    Stub boto3 and AWS Secrets Manager so AWSArchival talks to a FakeS3.
+    """
+    s3 = FakeS3()
+    monkeypatch.setattr(boto3, 'client', lambda *args, **kwargs: s3)
+    monkeypatch.setattr(SecretsManager, 'get_aws_secrets', lambda self, secret_name, region_name: {
+        "aws_access_key_id": "key",
+        "aws_secret_access_key": "secret",
+        "bucket_name": "secret-bucket",
+    })
+    return s3
+
+class FakeFileClient:
+    """
+    In-memory stand-in for an ADLS file client.
+    """
+
+    def __init__(self, adls, path):
+        self.adls = adls
+        self.path = path
+
+    def get_file_properties(self):
+        return {'last_modified': self.adls.files[self.path]}
+
+    def delete_file(self):
+        if self.path in self.adls.failing:
+            raise RuntimeError(f"delete of {self.path} denied")
+        self.adls.deletes.append(self.path)
+
+    def set_access_tier(self, tier):
+        if self.path in self.adls.failing:
+            raise RuntimeError(f"move of {self.path} denied")
+        self.adls.moves.append((self.path, tier))
+
+class FakePath:
+    def __init__(self, name):
+        self.name = name
+
+class FakeADLS:
+    """
+    In-memory stand-in for the ADLS and Blob service clients.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.failing = set()
+        self.deletes = []
+        self.moves = []
+        self.clients_created = 0
+        self.file_system_names = []
+        self.container_names = []
+
+    def from_connection_string(self, connection_string):
+        self.clients_created += 1
+        return self
+
+    def get_file_system_client(self, file_system_name):
+        self.file_system_names.append(file_system_name)
+        return self
+
+    def get_paths(self):
+        return [FakePath(path) for path in self.files]
+
+    def get_file_client(self, path):
+        return FakeFileClient(self, path)
+
+    def get_container_client(self, container_name):
+        self.container_names.append(container_name)
+        return container_name
+
+@pytest.fixture
+def fake_adls(monkeypatch):
+    """
+    Stub the Azure SDK clients and Azure Key Vault so AzureArchival talks to a FakeADLS.
+    """
+    adls = FakeADLS()
+    monkeypatch.setattr(azure_archival, 'DataLakeServiceClient', adls)
+    monkeypatch.setattr(azure_archival, 'BlobServiceClient', adls)
+    monkeypatch.setattr(SecretsManager, 'get_azure_secrets', lambda self, secret_name, key_vault_name: {
+        "connection_string": "UseDevelopmentStorage=true",
+    })
+    return adls
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from archival_manager import ArchivalManager
+from utils.secrets import SecretsManager
+from utils.targets import Target
+
+def aws_target(name, secret_name='aws_secret'):
+    return Target(name=name, cloud='aws', secret_name=secret_name, region_name='us-west-2', bucket_name=name, max_concurrency=2)
+
+def azure_target(name):
+    return Target(name=name, cloud='azure', secret_name='azure_secret', key_vault_name='vault', file_system_name=name, max_concurrency=2)
+
+def s3_object(key, age_days):
+    return {'Key': key, 'LastModified': datetime.now(timezone.utc) - timedelta(days=age_days)}
+
+def test_runs_action_across_clouds(fake_s3, fake_adls):
+    fake_s3.pages = [{'Contents': [s3_object('a', 10), s3_object('b', 10)]}]
+    fake_adls.files['raw/new.csv'] = datetime.utcnow() - timedelta(days=10)
+
+    progress = ArchivalManager().perform_targets([aws_target('logs'), azure_target('raw')], 'archive', 'real_time', 4)
+
+    assert progress.targets['logs'].succeeded == 2
+    assert progress.targets['raw'].succeeded == 1
+    assert progress.failed == 0
+    assert progress.failed_targets == []
+    assert fake_adls.moves == [('raw/new.csv', 'real-time')]
+
+def test_setup_failure_becomes_failed_target(fake_s3, monkeypatch):
+    fake_s3.pages = [{'Contents': [s3_object('a', 10)]}]
+    secrets = {"aws_access_key_id": "key", "aws_secret_access_key": "secret", "bucket_name": "secret-bucket"}
+    monkeypatch.setattr(SecretsManager, 'get_aws_secrets',
+                        lambda self, secret_name, region_name: None if secret_name == 'missing' else secrets)
+    manager = ArchivalManager()
+
+    progress = manager.perform_targets([aws_target('broken', secret_name='missing'), aws_target('logs')], 'archive', 'real_time', 4)
+
+    assert progress.failed_targets == ['broken']
+    assert progress.targets['broken'].done
+    assert progress.targets['logs'].succeeded == 1
+    failures = [movement for movement in manager.traceability.get_movements() if movement['status'] == 'failure']
+    assert [(movement['service'], movement['action'], movement['file_path']) for movement in failures] == [('AWS', 'archive', 'broken')]
+
+def test_rejects_restore_for_azure_targets(fake_s3, fake_adls):
+    fake_s3.pages = [{'Contents': [s3_object('a', 2000)]}]
+    fake_adls.files['raw/new.csv'] = datetime.utcnow() - timedelta(days=10)
+    manager = ArchivalManager()
+
+    progress = manager.perform_targets([aws_target('logs'), azure_target('raw')], 'restore', 'archival', 4)
+
+    assert fake_adls.clients_created == 0
+    assert progress.failed_targets == ['raw']
+    assert progress.targets['raw'].error == "restore is not supported for Azure targets"
+    assert progress.targets['logs'].succeeded == 1
+    failures = [movement for movement in manager.traceability.get_movements() if movement['status'] == 'failure']
+    assert [(movement['service'], movement['action'], movement['file_path']) for movement in failures] == [('Azure', 'restore', 'raw')]
+
+def test_rejects_unknown_action_before_setup(monkeypatch):
+    calls = []
+    monkeypatch.setattr(SecretsManager, 'get_aws_secrets', lambda self, secret_name, region_name: calls.append(secret_name))
+
+    with pytest.raises(ValueError, match="Unsupported action 'copy'"):
+        ArchivalManager().perform_targets([aws_target('logs')], 'copy', 'real_time', 4)
+
+    assert calls == []
@@ -0,0 +1,116 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aws_archival import AWSArchival
+
+def s3_object(key, age_days):
+    return {'Key': key, 'LastModified': datetime.now(timezone.utc) - timedelta(days=age_days)}
+
+def test_list_items_paginates_and_skips_empty_pages(fake_s3):
+    fake_s3.pages = [
+        {'Contents': [s3_object('a', 1), s3_object('b', 1)]},
+        {},
+        {'Contents': [s3_object('c', 1)]},
+    ]
+    archival = AWSArchival('aws_secret', 'us-west-2', bucket_name='logs')
+
+    assert [obj['Key'] for obj in archival.list_items()] == ['a', 'b', 'c']
+    assert fake_s3.paginated_buckets == ['logs']
+
+def test_bucket_defaults_to_secret(fake_s3):
+    archival = AWSArchival('aws_secret', 'us-west-2')
+
+    list(archival.list_items())
+
+    assert fake_s3.paginated_buckets == ['secret-bucket']
+
+@pytest.mark.parametrize("data_type, age_days", [
+    ('real_time', 100),
+    ('reference', 10),
+    ('reference', 2000),
+    ('archival', 100),
+    ('archival', 4000),
+])
+def test_delete_item_skips_ineligible_objects(fake_s3, data_type, age_days):
+    archival = AWSArchival('aws_secret', 'us-west-2')
+
+    assert archival.delete_item(s3_object('key', age_days), data_type) is True
+    assert fake_s3.deletes == []
+    assert archival.traceability.get_movements() == []
+
+@pytest.mark.parametrize("data_type, age_days", [('real_time', 10), ('reference', 100), ('archival', 2000)])
+def test_delete_item_deletes_eligible_objects_once(fake_s3, data_type, age_days):
+    archival = AWSArchival('aws_secret', 'us-west-2')
+
+    assert archival.delete_item(s3_object('key', age_days), data_type) is True
+    assert fake_s3.deletes == [('secret-bucket', 'key')]
+    assert [(movement['action'], movement['tier'], movement['status']) for movement in archival.traceability.get_movements()] == [
+        ('delete', data_type, 'success'),
+    ]
+
+def test_delete_item_records_a_single_failure(fake_s3):
+    fake_s3.failing.add('key')
+    archival = AWSArchival('aws_secret', 'us-west-2')
+
+    assert archival.delete_item(s3_object('key', 10), 'real_time') is False
+    assert [(movement['action'], movement['status']) for movement in archival.traceability.get_movements()] == [
+        ('delete', 'failure'),
+    ]
+
+@pytest.mark.parametrize("age_days, storage_class", [(10, 'STANDARD'), (100, 'STANDARD_IA'), (2000, 'GLACIER')])
+def test_archive_item_moves_by_age(fake_s3, age_days, storage_class):
+    archival = AWSArchival('aws_secret', 'us-west-2')
+
+    assert archival.archive_item(s3_object('key', age_days), 'reference') is True
+    assert fake_s3.copies == [('secret-bucket', 'key', storage_class)]
+    assert [(movement['action'], movement['status']) for movement in archival.traceability.get_movements()] == [
+        ('move', 'success'),
+        ('archive', 'success'),
+    ]
+
+def test_archive_item_records_failure(fake_s3):
+    fake_s3.failing.add('key')
+    archival = AWSArchival('aws_secret', 'us-west-2')
+
+    assert archival.archive_item(s3_object('key', 10), 'real_time') is False
+    assert [(movement['action'], movement['status']) for movement in archival.traceability.get_movements()] == [
+        ('move', 'failure'),
+        ('archive', 'failure'),
+    ]
+
+def test_restore_item(fake_s3):
+    archival = AWSArchival('aws_secret', 'us-west-2')
+
+    assert archival.restore_item(s3_object('key', 2000), 'archival') is True
+    assert fake_s3.copies == [('secret-bucket', 'key', 'STANDARD')]
+    assert [(movement['action'], movement['status']) for movement in archival.traceability.get_movements()] == [
+        ('restore', 'success'),
+    ]
+
+def test_restore_item_records_failure(fake_s3):
+    fake_s3.failing.add('key')
+    archival = AWSArchival('aws_secret', 'us-west-2')
+
+    assert archival.restore_item(s3_object('key', 2000), 'archival') is False
+    movements = archival.traceability.get_movements()
+    assert [(movement['action'], movement['status']) for movement in movements] == [('restore', 'failure')]
+    assert movements[0]['error_message'] == 'copy of key denied'
+
+def test_archive_data_processes_every_page(fake_s3):
+    fake_s3.pages = [{'Contents': [s3_object('a', 10)]}, {'Contents': [s3_object('b', 10)]}]
+    archival = AWSArchival('aws_secret', 'us-west-2')
+
+    archival.archive_data('real_time')
+
+    assert [key for _, key, _ in fake_s3.copies] == ['a', 'b']
+
+def test_archive_data_reports_empty_bucket(fake_s3, caplog):
+    fake_s3.pages = [{}]
+    archival = AWSArchival('aws_secret', 'us-west-2')
+
+    with caplog.at_level(logging.INFO, logger='aws_archival'):
+        archival.archive_data('real_time')
+
+    assert "No objects found in the bucket." in caplog.messages
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from azure_archival import AzureArchival
+
+def add_file(adls, path, age_days):
+    adls.files[path] = datetime.utcnow() - timedelta(days=age_days)
+
+def test_list_items_uses_configured_file_system(fake_adls):
+    add_file(fake_adls, 'raw/a.csv', 1)
+    add_file(fake_adls, 'raw/b.csv', 1)
+    archival = AzureArchival('azure_secret', 'vault', file_system_name='raw')
+
+    assert list(archival.list_items()) == ['raw/a.csv', 'raw/b.csv']
+    assert fake_adls.file_system_names == ['raw']
+
+def test_container_client_is_optional(fake_adls):
+    assert AzureArchival('azure_secret', 'vault', file_system_name='raw').container_client is None
+    assert AzureArchival('azure_secret', 'vault', file_system_name='raw', container_name='uploads').container_client == 'uploads'
+
+def test_delete_item_skips_ineligible_paths(fake_adls):
+    add_file(fake_adls, 'old.csv', 100)
+    archival = AzureArchival('azure_secret', 'vault', file_system_name='raw')
+
+    assert archival.delete_item('old.csv', 'real_time') is True
+    assert fake_adls.deletes == []
+    assert archival.traceability.get_movements() == []
+
+def test_delete_item_deletes_eligible_paths(fake_adls):
+    add_file(fake_adls, 'new.csv', 10)
+    archival = AzureArchival('azure_secret', 'vault', file_system_name='raw')
+
+    assert archival.delete_item('new.csv', 'real_time') is True
+    assert fake_adls.deletes == ['new.csv']
+    assert [(movement['action'], movement['status']) for movement in archival.traceability.get_movements()] == [
+        ('delete', 'success'),
+    ]
+
+def test_delete_item_records_failure(fake_adls):
+    add_file(fake_adls, 'new.csv', 10)
+    fake_adls.failing.add('new.csv')
+    archival = AzureArchival('azure_secret', 'vault', file_system_name='raw')
+
+    assert archival.delete_item('new.csv', 'real_time') is False
+    assert [(movement['action'], movement['status']) for movement in archival.traceability.get_movements()] == [
+        ('delete', 'failure'),
+    ]
+
+def test_archive_item_skips_ineligible_paths(fake_adls):
+    add_file(fake_adls, 'old.csv', 4000)
+    archival = AzureArchival('azure_secret', 'vault', file_system_name='raw')
+
+    assert archival.archive_item('old.csv', 'archival') is True
+    assert fake_adls.moves == []
+    assert archival.traceability.get_movements() == []
+
+@pytest.mark.parametrize("data_type, tier", [('real_time', 'real-time'), ('reference', 'reference'), ('archival', 'archival')])
+def test_archive_item_moves_eligible_paths(fake_adls, data_type, tier):
+    add_file(fake_adls, 'new.csv', 10)
+    archival = AzureArchival('azure_secret', 'vault', file_system_name='raw')
+
+    assert archival.archive_item('new.csv', data_type) is True
+    assert fake_adls.moves == [('new.csv', tier)]
+    assert [(movement['action'], movement['status']) for movement in archival.traceability.get_movements()] == [
+        ('move', 'success'),
+        ('archive', 'success'),
+    ]
+
+def test_archive_item_records_failure(fake_adls):
+    add_file(fake_adls, 'new.csv', 10)
+    fake_adls.failing.add('new.csv')
+    archival = AzureArchival('azure_secret', 'vault', file_system_name='raw')
+
+    assert archival.archive_item('new.csv', 'real_time') is False
+    assert [(movement['action'], movement['status']) for movement in archival.traceability.get_movements()] == [
+        ('move', 'failure'),
+        ('archive', 'failure'),
+    ]
+
+def test_restore_item_is_recorded_as_unsupported(fake_adls):
+    add_file(fake_adls, 'new.csv', 10)
+    archival = AzureArchival('azure_secret', 'vault', file_system_name='raw')
+
+    assert archival.restore_item('new.csv', 'real_time') is False
+    movements = archival.traceability.get_movements()
+    assert [(movement['action'], movement['file_path'], movement['status']) for movement in movements] == [
+        ('restore', 'new.csv', 'failure'),
+    ]
+    assert movements[0]['error_message'] == "restore is not supported for Azure targets"
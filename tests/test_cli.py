@@ -0,0 +1,73 @@
+from click.testing import CliRunner
+
+import src.cli as cli_module
+from orchestrator import ProgressTracker
+
+class FakeManager:
+    """
+    ArchivalManager stand-in that returns a canned progress report.
+    """
+
+    progress = None
+    calls = []
+
+    def perform_targets(self, targets, action, data_type, max_concurrency):
+        FakeManager.calls.append(([target.name for target in targets], action, data_type, max_concurrency))
+        return FakeManager.progress
+
+def write_manifest(tmp_path, content):
+    path = tmp_path / "targets.yaml"
+    path.write_text(content)
+    return str(path)
+
+def make_progress(succeeded, failed):
+    progress = ProgressTracker()
+    target = progress.register("logs", "AWS")
+    target.listed = succeeded + failed
+    target.succeeded = succeeded
+    target.failed = failed
+    target.listing_done = True
+    return progress
+
+MANIFEST = "max_concurrency: 8\ntargets:\n  - {cloud: aws, secret_name: s, region_name: us-west-2, bucket_name: logs}\n"
+
+def test_bad_manifest_is_a_parameter_error(tmp_path):
+    manifest = write_manifest(tmp_path, "targets:\n  - just-a-string\n")
+
+    result = CliRunner().invoke(cli_module.auto_archive, ['real_time', '--targets', manifest])
+
+    assert result.exit_code == 2
+    assert "Invalid value for" in result.output and "--targets" in result.output
+    assert "must be mappings" in result.output
+
+def test_runs_targets_and_prints_summary(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli_module, 'ArchivalManager', FakeManager)
+    FakeManager.calls = []
+    FakeManager.progress = make_progress(succeeded=3, failed=0)
+
+    result = CliRunner().invoke(cli_module.auto_archive, ['real_time', '--targets', write_manifest(tmp_path, MANIFEST)])
+
+    assert result.exit_code == 0
+    assert FakeManager.calls == [(['logs'], 'archive', 'real_time', 8)]
+    assert "logs [AWS] done: 3 listed, 3 succeeded, 0 failed, 0 in flight" in result.output
+
+def test_max_concurrency_overrides_manifest(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli_module, 'ArchivalManager', FakeManager)
+    FakeManager.calls = []
+    FakeManager.progress = make_progress(succeeded=1, failed=0)
+
+    result = CliRunner().invoke(cli_module.auto_archive,
+                                ['real_time', '--targets', write_manifest(tmp_path, MANIFEST), '--max-concurrency', '2'])
+
+    assert result.exit_code == 0
+    assert FakeManager.calls == [(['logs'], 'archive', 'real_time', 2)]
+
+def test_failed_objects_fail_the_command(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli_module, 'ArchivalManager', FakeManager)
+    FakeManager.calls = []
+    FakeManager.progress = make_progress(succeeded=2, failed=1)
+
+    result = CliRunner().invoke(cli_module.auto_archive, ['real_time', '--targets', write_manifest(tmp_path, MANIFEST)])
+
+    assert result.exit_code == 1
+    assert "Error: 1 objects failed, 0 targets errored" in result.output
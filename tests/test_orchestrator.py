@@ -0,0 +1,178 @@
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from orchestrator import TargetOrchestrator
+
+class FakeArchival:
+    """
+    Archival stand-in that lists in-memory items and records how they are processed.
+    """
+
+    def __init__(self, name, items, recorder, fail_after=None, result=True, delay=0.0):
+        self.name = name
+        self.items = list(items)
+        self.recorder = recorder
+        self.fail_after = fail_after
+        self.result = result
+        self.delay = delay
+        self.listed = threading.Event()
+
+    def list_items(self):
+        for index, item in enumerate(self.items):
+            if self.fail_after is not None and index == self.fail_after:
+                raise RuntimeError("listing denied")
+            yield item
+        self.listed.set()
+
+    def archive_item(self, item, data_type):
+        self.recorder.start(self.name)
+        try:
+            time.sleep(self.delay)
+            if isinstance(self.result, Exception):
+                raise self.result
+            return self.result
+        finally:
+            self.recorder.finish(self.name)
+
+class Recorder:
+    """
+    Thread-safe record of processing order and peak concurrency.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.order = []
+        self.active = Counter()
+        self.total_active = 0
+        self.peak = Counter()
+        self.total_peak = 0
+        self.gate = None
+
+    def start(self, name):
+        with self.lock:
+            self.order.append(name)
+            self.active[name] += 1
+            self.total_active += 1
+            self.peak[name] = max(self.peak[name], self.active[name])
+            self.total_peak = max(self.total_peak, self.total_active)
+            gate, self.gate = self.gate, None
+        if gate:
+            gate()
+
+    def finish(self, name):
+        with self.lock:
+            self.active[name] -= 1
+            self.total_active -= 1
+
+def test_respects_global_and_per_target_caps():
+    recorder = Recorder()
+    orchestrator = TargetOrchestrator(5, progress_interval=1)
+    orchestrator.add_target("giant", "AWS", FakeArchival("giant", range(60), recorder, delay=0.005), 3)
+    orchestrator.add_target("medium", "AWS", FakeArchival("medium", range(30), recorder, delay=0.005), 2)
+    orchestrator.add_target("small", "Azure", FakeArchival("small", range(10), recorder, delay=0.005), 4)
+
+    progress = orchestrator.run("archive", "real_time")
+
+    assert recorder.peak["giant"] <= 3
+    assert recorder.peak["medium"] <= 2
+    assert recorder.peak["small"] <= 4
+    assert recorder.total_peak <= 5
+    assert progress.succeeded == 100
+    assert progress.failed == 0
+    assert all(target.done for target in progress.targets.values())
+
+def test_serves_targets_round_robin():
+    recorder = Recorder()
+    archivals = [FakeArchival(name, range(count), recorder) for name, count in (("a", 6), ("b", 6), ("c", 3))]
+    # Hold the first object until every target is fully listed, so the rest of the order is deterministic.
+    recorder.gate = lambda: [archival.listed.wait(5) for archival in archivals]
+    orchestrator = TargetOrchestrator(1, progress_interval=1)
+    for archival in archivals:
+        orchestrator.add_target(archival.name, "AWS", archival, 1)
+
+    orchestrator.run("archive", "real_time")
+
+    assert len(recorder.order) == 15
+    assert Counter(recorder.order[1:7]) == {"a": 2, "b": 2, "c": 2}
+    assert max(index for index, name in enumerate(recorder.order) if name == "c") < 9
+
+def test_listing_failure_partway_keeps_listed_objects_and_other_targets():
+    recorder = Recorder()
+    orchestrator = TargetOrchestrator(4, progress_interval=1)
+    orchestrator.add_target("broken", "AWS", FakeArchival("broken", range(10), recorder, fail_after=3), 2)
+    orchestrator.add_target("healthy", "Azure", FakeArchival("healthy", range(5), recorder), 2)
+
+    progress = orchestrator.run("archive", "real_time")
+
+    broken = progress.targets["broken"]
+    assert broken.listed == 3
+    assert broken.succeeded == 3
+    assert broken.error == "listing denied"
+    assert broken.done
+    assert progress.targets["healthy"].succeeded == 5
+    assert progress.failed_targets == ["broken"]
+    failures = [movement for movement in orchestrator.traceability.get_movements() if movement["status"] == "failure"]
+    assert [(movement["service"], movement["action"], movement["file_path"]) for movement in failures] == [("AWS", "list", "broken")]
+
+def test_counts_listed_objects_before_they_are_dispatched():
+    recorder = Recorder()
+    archival = FakeArchival("bucket", range(5), recorder)
+    orchestrator = TargetOrchestrator(1, progress_interval=1)
+    orchestrator.add_target("bucket", "AWS", archival, 1)
+    snapshots = []
+
+    def snapshot():
+        archival.listed.wait(5)
+        progress = orchestrator.progress.targets["bucket"]
+        snapshots.append((progress.listed, progress.succeeded))
+    recorder.gate = snapshot
+
+    progress = orchestrator.run("archive", "real_time")
+
+    assert snapshots == [(5, 0)]
+    assert progress.targets["bucket"].listed == 5
+    assert progress.targets["bucket"].succeeded == 5
+
+@pytest.mark.parametrize("result", [False, RuntimeError("boom")])
+def test_failed_handlers_are_counted(result):
+    recorder = Recorder()
+    orchestrator = TargetOrchestrator(2, progress_interval=1)
+    orchestrator.add_target("failing", "AWS", FakeArchival("failing", range(4), recorder, result=result), 2)
+    orchestrator.add_target("passing", "AWS", FakeArchival("passing", range(3), recorder, result=None), 2)
+
+    progress = orchestrator.run("archive", "real_time")
+
+    assert progress.targets["failing"].failed == 4
+    assert progress.targets["failing"].succeeded == 0
+    assert progress.targets["passing"].succeeded == 3
+    assert progress.failed == 4
+    assert progress.failed_targets == []
+
+def test_failed_target_is_reported_without_blocking_the_run():
+    recorder = Recorder()
+    orchestrator = TargetOrchestrator(2, progress_interval=1)
+    orchestrator.add_failed_target("unreachable", "Azure", "no credentials")
+    orchestrator.add_target("bucket", "AWS", FakeArchival("bucket", range(2), recorder), 2)
+
+    progress = orchestrator.run("archive", "real_time")
+
+    unreachable = progress.targets["unreachable"]
+    assert unreachable.done
+    assert unreachable.listed == 0
+    assert progress.failed_targets == ["unreachable"]
+    assert progress.succeeded == 2
+    assert progress.failed == 0
+    assert progress.summary_lines()[-1] == "Total: 2/2 targets finished, 2 succeeded, 0 failed, 1 targets errored"
+    assert "(no credentials)" in progress.summary_lines()[0]
+
+def test_rejects_unsupported_action():
+    orchestrator = TargetOrchestrator(1)
+    with pytest.raises(ValueError):
+        orchestrator.run("copy", "real_time")
+
+def test_rejects_non_positive_concurrency():
+    with pytest.raises(ValueError):
+        TargetOrchestrator(0)
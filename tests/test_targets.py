@@ -0,0 +1,67 @@
+import pytest
+import yaml
+
+from utils.targets import DEFAULT_MAX_CONCURRENCY, load_targets
+
+AWS_TARGET = "{cloud: aws, secret_name: aws_secret, region_name: us-west-2, bucket_name: logs}"
+AZURE_TARGET = "{name: lake, cloud: azure, secret_name: azure_secret, key_vault_name: vault, file_system_name: raw}"
+
+def write_manifest(tmp_path, content):
+    path = tmp_path / "targets.yaml"
+    path.write_text(content)
+    return str(path)
+
+def test_loads_targets_with_defaults(tmp_path):
+    manifest = write_manifest(tmp_path, f"""
+max_concurrency: 8
+defaults:
+  max_concurrency: 3
+targets:
+  - {AWS_TARGET}
+  - {{name: lake, cloud: Azure, secret_name: azure_secret, key_vault_name: vault, file_system_name: raw, max_concurrency: 5}}
+""")
+
+    targets, max_concurrency = load_targets(manifest)
+
+    assert max_concurrency == 8
+    assert [(target.name, target.cloud, target.max_concurrency) for target in targets] == [("logs", "aws", 3), ("lake", "azure", 5)]
+    assert targets[0].region_name == "us-west-2"
+    assert targets[1].file_system_name == "raw"
+
+def test_uses_default_global_concurrency(tmp_path):
+    _, max_concurrency = load_targets(write_manifest(tmp_path, f"targets:\n  - {AWS_TARGET}\n"))
+    assert max_concurrency == DEFAULT_MAX_CONCURRENCY
+
+@pytest.mark.parametrize("entry, message", [
+    ("{cloud: gcp, secret_name: s}", "unsupported cloud"),
+    ("{cloud: aws, region_name: us-west-2}", "missing 'secret_name'"),
+    ("{cloud: aws, secret_name: s}", "missing 'region_name'"),
+    ("{cloud: azure, secret_name: s, key_vault_name: vault}", "requires 'key_vault_name' and 'file_system_name'"),
+    ("just-a-string", "must be mappings"),
+])
+def test_rejects_invalid_targets(tmp_path, entry, message):
+    with pytest.raises(ValueError, match=message):
+        load_targets(write_manifest(tmp_path, f"targets:\n  - {entry}\n"))
+
+def test_rejects_duplicate_names(tmp_path):
+    with pytest.raises(ValueError, match="duplicate target names: logs"):
+        load_targets(write_manifest(tmp_path, f"targets:\n  - {AWS_TARGET}\n  - {AWS_TARGET}\n"))
+
+@pytest.mark.parametrize("value", ["", "0", "-2", "'4'", "true", "2.5"])
+def test_rejects_bad_global_concurrency(tmp_path, value):
+    with pytest.raises(ValueError, match="positive integer 'max_concurrency'"):
+        load_targets(write_manifest(tmp_path, f"max_concurrency: {value}\ntargets:\n  - {AWS_TARGET}\n"))
+
+@pytest.mark.parametrize("value", ["", "0", "'4'"])
+def test_rejects_bad_target_concurrency(tmp_path, value):
+    with pytest.raises(ValueError, match="positive integer 'max_concurrency'"):
+        load_targets(write_manifest(tmp_path, f"targets:\n  - {AZURE_TARGET}\ndefaults:\n  max_concurrency: {value}\n"))
+
+@pytest.mark.parametrize("content", ["", "targets: lake\n", "- lake\n", f"defaults: [1]\ntargets:\n  - {AWS_TARGET}\n"])
+def test_rejects_malformed_manifests(tmp_path, content):
+    with pytest.raises(ValueError):
+        load_targets(write_manifest(tmp_path, content))
+
+def test_invalid_yaml_raises_yaml_error(tmp_path):
+    with pytest.raises(yaml.YAMLError):
+        load_targets(write_manifest(tmp_path, "targets: [unclosed\n"))